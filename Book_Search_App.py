@@ -1,6 +1,48 @@
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import atexit
+import collections
+import contextlib
+import dataclasses
+import hashlib
 import json
+import mmap
 import os
+import sqlite3
+import sys
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional; API responses are then fully decoded
+    simdjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; API responses then go through simdjson/orjson/json
+    msgspec = None
+
+
+def _json_loads(data: bytes):
+    """Decodes JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encodes an object to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 
 #Custom Exceptions
 class APIError(Exception):
@@ -12,71 +54,235 @@ class FileLoadError(Exception):
     pass
 
 
+@dataclasses.dataclass(slots=True)
 class Book:
     """Represents a single book with key metadata"""
-    
-    def __init__(self, title, author, publisher=None, isbn=None):
-        self.title = title
-        self.author = author
-        self.publisher = publisher
-        self.isbn = isbn
+
+    title: str
+    author: str
+    publisher: str | None = None
+    isbn: str | None = None
+
+    # One prebuilt template per (has publisher, has ISBN) combination, indexed as a 2-bit number
+    _FORMATS = (
+        lambda b: f"Title: {b.title}\nAuthor: {b.author}",
+        lambda b: f"Title: {b.title}\nAuthor: {b.author}\nISBN: {b.isbn}",
+        lambda b: f"Title: {b.title}\nAuthor: {b.author}\nPublisher: {b.publisher}",
+        lambda b: f"Title: {b.title}\nAuthor: {b.author}\nPublisher: {b.publisher}\nISBN: {b.isbn}",
+    )
 
     def display_info(self):
         """Generates a formatted string for console display"""
-        info_lines = [f"Title: {self.title}", f"Author: {self.author}"]
-        if self.publisher:
-            info_lines.append(f"Publisher: {self.publisher}")
-        if self.isbn:
-            info_lines.append(f"ISBN: {self.isbn}")
-        return "\n".join(info_lines)
+        return self._FORMATS[(bool(self.publisher) << 1) | bool(self.isbn)](self)
 
     def to_dict(self):
         """Converts the Book object to a dictionary for JSON serialization"""
-        return self.__dict__
+        return dataclasses.asdict(self)
 
     def __repr__(self):
         return f"<Book title='{self.title[:30]}...' author='{self.author}'>"
 
+def _book_from_dict(data: dict) -> Book:
+    """Builds a Book positionally (no **kwargs unpacking); publisher and isbn are optional"""
+    return Book(data['title'], data['author'], data.get('publisher'), data.get('isbn'))
+
+
+def _book_data(title, authors, publisher, ids: dict) -> dict:
+    """
+    Builds one simplified book data dict from fields pulled out of an API item.
+    Missing values (None) get the display fallbacks, and the ISBN is chosen from the
+    type->identifier dict as ISBN_13, then ISBN_10, then any other identifier.
+    """
+    return {
+        'title': title if title is not None else 'N/A Title',
+        'author': ', '.join(authors) if authors is not None else 'Unknown Author',
+        'publisher': publisher,
+        'isbn': ids.get('ISBN_13') or ids.get('ISBN_10') or next(iter(ids.values()), None)
+    }
+
 #API Interaction
+if msgspec is not None:
+    # Typed schema for the Books API response; the decoder skips every other field
+    class Identifier(msgspec.Struct):
+        type: str | None = None
+        identifier: str | None = None
+
+    class VolumeInfo(msgspec.Struct):
+        title: str | None = None
+        authors: list[str] | None = None
+        publisher: str | None = None
+        industryIdentifiers: list[Identifier] = []
+
+    class Volume(msgspec.Struct):
+        volumeInfo: VolumeInfo = msgspec.field(default_factory=VolumeInfo)
+
+    class BooksResponse(msgspec.Struct):
+        items: list[Volume] = []
+
+    _books_response_decoder = msgspec.json.Decoder(BooksResponse)
+
 class APIClient:
     """Handles external API calls for book searching"""
     
     BASE_URL = "https://www.googleapis.com/books/v1/volumes"
+    # Partial response: ask the API for only the fields search results actually use
+    RESPONSE_FIELDS = 'items(volumeInfo(title,authors,publisher,industryIdentifiers))'
+    CACHE_FILE = 'search_cache.sqlite3'
+    CACHE_TTL_SECONDS = 24 * 60 * 60
+    MEMORY_CACHE_SIZE = 128
+    # Matches the session's pool size so concurrent searches never open extra sockets
+    MAX_CONCURRENT_SEARCHES = 8
+
+    def __init__(self, cache_path=CACHE_FILE):
+        # One pooled session so repeated searches reuse the same HTTPS connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        self.cache_path = cache_path
+        # Per-instance in-memory LRU cache (query -> (fetched_at, books)) in front of the on-disk cache
+        self._memory_cache = collections.OrderedDict()
+        # Queries currently being fetched, so concurrent identical searches wait instead of refetching
+        self._inflight: dict[str, threading.Event] = {}
+        self._cache_lock = threading.Lock()
+        # simdjson Parsers reuse their internal buffers across parses but are not thread-safe,
+        # so batch searches (which run in worker threads) get one Parser per thread
+        self._parsers = threading.local()
 
     def search_books(self, query: str) -> list[dict]:
         """
-        Executes the book search. Returns a list of simplified book data dicts.
+        Executes the book search, serving repeated queries from cache.
+        Cached results (in memory and on disk) expire after CACHE_TTL_SECONDS;
+        empty results are never cached.
+        Returns a list of simplified book data dicts.
         Raises APIError on communication failure
         """
-        params = {'q': query, 'maxResults': 8} 
+        query = query.lower().strip()
+        while True:
+            with self._cache_lock:
+                cached = self._memory_lookup(query)
+                if cached is not None:
+                    return cached
+                pending = self._inflight.get(query)
+                if pending is None:
+                    pending = self._inflight[query] = threading.Event()
+                    break
+            # Another thread is fetching this query; wait for it, then re-check the cache
+            pending.wait()
+
+        try:
+            fetched_at, books = self._search_books_disk_cached(query)
+            if books:
+                with self._cache_lock:
+                    self._memory_cache[query] = (fetched_at, books)
+                    if len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                        self._memory_cache.popitem(last=False)
+            return books
+        finally:
+            with self._cache_lock:
+                del self._inflight[query]
+            pending.set()
+
+    def _memory_lookup(self, query: str):
+        """Returns unexpired in-memory results for query, or None. Caller holds _cache_lock."""
+        entry = self._memory_cache.get(query)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > self.CACHE_TTL_SECONDS:
+            del self._memory_cache[query]
+            return None
+        self._memory_cache.move_to_end(query)
+        return entry[1]
+
+    async def search_books_async(self, query: str) -> list[dict]:
+        """Runs search_books in a worker thread so several searches can overlap"""
+        return await asyncio.to_thread(self.search_books, query)
+
+    def search_many(self, queries: list[str]) -> list:
+        """
+        Executes several searches concurrently.
+        Returns one entry per query, in order: either its list of book data dicts
+        or the APIError raised for that query.
+        """
+        async def gather_searches():
+            limit = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+
+            async def limited_search(query):
+                async with limit:
+                    return await self.search_books_async(query)
+
+            return await asyncio.gather(*(limited_search(q) for q in queries), return_exceptions=True)
+
+        return asyncio.run(gather_searches())
+
+    def _search_books_disk_cached(self, query: str) -> tuple[float, list[dict]]:
+        """
+        Checks the on-disk cache before falling back to the API.
+        Returns (fetched_at, books) so the in-memory cache can expire with the same clock.
+        """
+        key = hashlib.sha1(query.encode('utf-8')).hexdigest()
+        cached = self._read_cache(key)
+        if cached is not None:
+            return cached
+        fetched_at = time.time()
+        books = self._search_books_uncached(query)
+        if books:
+            self._write_cache(key, fetched_at, books)
+        return fetched_at, books
+
+    def _connect_cache(self):
+        conn = sqlite3.connect(self.cache_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache "
+            "(key TEXT PRIMARY KEY, timestamp REAL, json_blob BLOB)"
+        )
+        return conn
+
+    def _read_cache(self, key: str):
+        """Returns (fetched_at, books) cached for key, or None if missing or expired"""
+        try:
+            with contextlib.closing(self._connect_cache()) as conn:
+                row = conn.execute(
+                    "SELECT timestamp, json_blob FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None or time.time() - row[0] > self.CACHE_TTL_SECONDS:
+                return None
+            return row[0], _json_loads(row[1])
+        except (sqlite3.Error, ValueError):
+            return None  # A broken cache must never block a search
+
+    def _write_cache(self, key: str, fetched_at: float, books: list[dict]):
+        try:
+            with contextlib.closing(self._connect_cache()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?)",
+                    (key, fetched_at, _json_dumps(books)),
+                )
+        except sqlite3.Error:
+            pass
+
+    def _search_books_uncached(self, query: str) -> list[dict]:
+        """
+        Executes the book search against the API.
+        Raises APIError on communication failure
+        """
+        params = {'q': query, 'maxResults': 8, 'fields': self.RESPONSE_FIELDS}
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=5) 
+            response = self.session.get(self.BASE_URL, params=params, timeout=5) 
             response.raise_for_status() 
-            
-            data = response.json()
-            if not data.get('items'):
-                return []
-            
-            parsed_books = []
-            for item in data['items']:
-                volume_info = item.get('volumeInfo', {})
-                authors_list = volume_info.get('authors', ['Unknown Author'])
-                
-                # Simplified ISBN extraction
-                identifiers = volume_info.get('industryIdentifiers', [])
-                isbn = next((i['identifier'] for i in identifiers if i.get('type') == 'ISBN_13'), 
-                            identifiers[0].get('identifier') if identifiers else None)
-
-                book_data = {
-                    'title': volume_info.get('title', 'N/A Title'),
-                    'author': ', '.join(authors_list),
-                    'publisher': volume_info.get('publisher'),
-                    'isbn': isbn
-                }
-                parsed_books.append(book_data)
-                
-            return parsed_books
+
+            if msgspec is not None:
+                return self._parse_volumes(_books_response_decoder.decode(response.content).items)
+
+            # simdjson parses lazily, so only the fields _parse_items reads become Python objects
+            if simdjson is not None:
+                data = self._simdjson_parse(response.content)
+            else:
+                data = _json_loads(response.content)
+            return self._parse_items(data.get('items') or [])
             
         except requests.exceptions.HTTPError as e:
             status_code = response.status_code if 'response' in locals() else 'Unknown'
@@ -88,140 +294,390 @@ class APIClient:
         except Exception as e:
             raise APIError(f"Failed to process API response: {type(e).__name__}: {e}") from e
 
+    def _simdjson_parse(self, content: bytes):
+        """Parses content with this thread's reusable simdjson Parser"""
+        parser = getattr(self._parsers, 'parser', None)
+        if parser is None:
+            parser = self._parsers.parser = simdjson.Parser()
+        try:
+            return parser.parse(content)
+        except RuntimeError:
+            # The previous document is still referenced (e.g. from a traceback); use a fresh Parser
+            parser = self._parsers.parser = simdjson.Parser()
+            return parser.parse(content)
+
+    @staticmethod
+    def _parse_items(items) -> list[dict]:
+        """Converts raw API items (dicts or simdjson objects) to simplified book data dicts"""
+        parsed_books = []
+        append = parsed_books.append
+        for item in items:
+            volume_info = item.get('volumeInfo', {})
+            ids = {i['type']: i['identifier'] for i in volume_info.get('industryIdentifiers', [])
+                   if 'type' in i and 'identifier' in i}
+            append(_book_data(volume_info.get('title'), volume_info.get('authors'),
+                              volume_info.get('publisher'), ids))
+        return parsed_books
+
+    @staticmethod
+    def _parse_volumes(volumes: list) -> list[dict]:
+        """Converts msgspec-decoded Volume structs to simplified book data dicts"""
+        parsed_books = []
+        append = parsed_books.append
+        for volume in volumes:
+            volume_info = volume.volumeInfo
+            ids = {i.type: i.identifier for i in volume_info.industryIdentifiers
+                   if i.type is not None and i.identifier is not None}
+            append(_book_data(volume_info.title, volume_info.authors, volume_info.publisher, ids))
+        return parsed_books
+
 #File Management
 class FileManager:
-    """Handles loading and saving the local library data to a JSON file"""
+    """Handles loading and saving the local library data to an append-only JSON Lines file"""
 
-    DEFAULT_FILE = 'my_library.json'
+    DEFAULT_FILE = 'my_library.jsonl'
+    # Below this size a plain read() is cheaper than setting up a memory map
+    MMAP_THRESHOLD = 64 * 1024
 
     def __init__(self, file_path=DEFAULT_FILE):
         self.file_path = file_path
+        # Appends go through one open handle: each is handed to the OS right away,
+        # but fsync (the expensive part) only happens on close
+        self._append_file = None
+        # Set when the file was created or replaced and its directory entry is not yet synced
+        self._needs_dir_sync = False
+        atexit.register(self._safe_close)
 
     def load_library(self) -> list[dict]:
-        """Loads data from the JSON file. Returns [] if missing."""
-        try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, list):
-                    print("Warning: Library file content was not a list. Re-initializing.")
-                    return []
-                return data
+        """Loads one book dict per line from the JSONL file. Returns [] if missing."""
+        try:
+            lines = self._read_lines()
+        except FileNotFoundError:
+            return self._import_legacy_library()
+        except IOError as e:
+            raise FileLoadError(f"Critical IO error while reading file: {e}") from e
+
+        # Identical records (e.g. the same book saved twice) collapse to one live entry
+        live_lines = list(dict.fromkeys(line.strip() for line in lines if line.strip()))
+        data = []
+        corrupted = non_books = 0
+        for line in live_lines:
+            # Each line is independent, so one torn or corrupted record never hides the rest
+            try:
+                record = _json_loads(line)
+            except ValueError:  # json.JSONDecodeError / UnicodeDecodeError
+                corrupted += 1
+                continue
+            if isinstance(record, dict):
+                data.append(record)
+            else:
+                non_books += 1
+
+        if corrupted:
+            print(f"Warning: Library file contained {corrupted} corrupted line(s) (JSON Error). Skipping them.")
+        if non_books:
+            print("Warning: Library file contained non-book entries. Skipping them.")
+        if corrupted or non_books:
+            # Skipped entries stay on disk untouched, so never compact in this case
+            return data
+
+        if len(lines) > 2 * len(live_lines):
+            self.compact(data)
+        return data
+
+    def _import_legacy_library(self) -> list[dict]:
+        """One-time import of a legacy JSON-array library (my_library.json) into the JSONL file"""
+        legacy_path = os.path.splitext(self.file_path)[0] + '.json'
+        try:
+            with open(legacy_path, 'rb') as f:
+                data = _json_loads(f.read())
         except FileNotFoundError:
             print(f"No library file found at '{self.file_path}'. Starting fresh.")
             return []
         except json.JSONDecodeError as e:
-            raise FileLoadError(f"Library file is corrupted (JSON Error).") from e
+            raise FileLoadError(f"Legacy library file '{legacy_path}' is corrupted (JSON Error).") from e
         except IOError as e:
             raise FileLoadError(f"Critical IO error while reading file: {e}") from e
 
+        if not isinstance(data, list):
+            print(f"Warning: Legacy library file '{legacy_path}' was not a list. Starting fresh.")
+            return []
+        data = [record for record in data if isinstance(record, dict)]
+        # The legacy file is left in place; the JSONL file takes over from here on
+        self.save_library(data)
+        print(f"Imported {len(data)} book(s) from legacy library file '{legacy_path}'.")
+        return data
+
+    def _read_lines(self) -> list[bytes]:
+        """Reads the raw lines of the library file, memory-mapping large files"""
+        with open(self.file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self.MMAP_THRESHOLD:
+                return f.read().splitlines()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return list(iter(mm.readline, b""))
+
+    def append_book(self, book_data: dict):
+        """Appends a single book record to the end of the JSONL file"""
+        try:
+            if self._append_file is None:
+                self._needs_dir_sync = self._needs_dir_sync or not os.path.exists(self.file_path)
+                self._append_file = open(self.file_path, 'ab')
+                if not self._ends_with_newline():
+                    # Terminate a torn last line so the new record starts on a line of its own
+                    self._append_file.write(b"\n")
+            self._append_file.write(_json_dumps(book_data) + b"\n")
+            self._append_file.flush()
+        except IOError as e:
+            raise FileLoadError(f"Failed to write library to disk: {e}") from e
+        except Exception as e:
+            raise FileLoadError(f"Unexpected error during saving: {e}") from e
+
+    def _ends_with_newline(self) -> bool:
+        """True if the library file is empty or its last byte is a newline"""
+        with open(self.file_path, 'rb') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def compact(self, library_data: list[dict]):
+        """Rewrites the file so it holds only the live library records"""
+        self.save_library(library_data)
+
     def save_library(self, library_data: list[dict]):
-        """Writes the library data to the JSON file"""
+        """
+        Writes the full library data to the JSONL file, replacing its contents.
+        The data goes to a temporary file that is fsynced before being swapped in with
+        os.replace, so neither a killed process nor a power loss can leave a half-written
+        library behind. This only runs at startup (compaction, legacy import), not per add.
+        """
+        # The append handle would keep writing to the replaced file; its records are
+        # already part of library_data, so a plain close (no fsync) is enough
+        if self._append_file is not None:
+            self._append_file.close()
+            self._append_file = None
+        tmp_path = self.file_path + '.tmp'
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(library_data, f, indent=4)
+            with open(tmp_path, 'wb') as f:
+                f.write(b"".join(_json_dumps(record) + b"\n" for record in library_data))
+                # The data must be durable before the rename makes it the only copy
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+            self._needs_dir_sync = True
         except IOError as e:
             raise FileLoadError(f"Failed to write library to disk: {e}") from e
         except Exception as e:
             raise FileLoadError(f"Unexpected error during saving: {e}") from e
 
+    def close(self):
+        """Flushes pending appends and any file replacement to disk and closes the library file"""
+        f, self._append_file = self._append_file, None
+        try:
+            if f is not None:
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            raise FileLoadError(f"Failed to write library to disk: {e}") from e
+        finally:
+            if f is not None:
+                f.close()
+        if self._needs_dir_sync:
+            self._needs_dir_sync = False
+            self._fsync_directory()
+
+    def _fsync_directory(self):
+        """Makes a created or replaced library file's directory entry durable"""
+        try:
+            dir_fd = os.open(os.path.dirname(os.path.abspath(self.file_path)), os.O_RDONLY)
+        except OSError:
+            return  # Directories cannot be opened for fsync on every platform (e.g. Windows)
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    def _safe_close(self):
+        """Like close(), but reports errors instead of raising (used at interpreter exit)"""
+        try:
+            self.close()
+        except FileLoadError as e:
+            print(f"FATAL SAVE ERROR: {e}")
+
 # Main Application
 class BookSearchApp:
     """The main application class that ties everything together"""
 
+    OUTPUT_BUFFER_SIZE = 8192
+
     def __init__(self):
+        # Console output is block-buffered and flushed once per prompt instead of once per line
+        self._out = self._open_output()
         self.api_client = APIClient()
         self.file_manager = FileManager()
         self.my_library: list[Book] = []
+        # ISBN index over my_library for O(1) duplicate checks
+        self.library_by_isbn: dict[str, Book] = {}
         self._load_initial_library()
 
+    def _open_output(self):
+        """Opens a block-buffered text stream on stdout, or falls back to sys.stdout itself"""
+        try:
+            return open(sys.stdout.fileno(), 'w', buffering=self.OUTPUT_BUFFER_SIZE,
+                        encoding=sys.stdout.encoding or 'utf-8', closefd=False)
+        except (AttributeError, OSError, ValueError):
+            return sys.stdout  # stdout is not backed by a real file descriptor
+
+    def _emit(self, message=""):
+        """Queues a line of console output"""
+        self._out.write(f"{message}\n")
+
+    def _flush(self):
+        """Writes out everything queued so far"""
+        sys.stdout.flush()
+        self._out.flush()
+
+    def _prompt(self, message: str) -> str:
+        """Flushes pending output so the prompt appears in order, then reads a line"""
+        self._flush()
+        return input(message)
+
     def _load_initial_library(self):
         """Initial load of the library from disk"""
         try:
             saved_data = self.file_manager.load_library()
-            self.my_library = [Book(**data) for data in saved_data]
-            print(f"Startup: Successfully loaded {len(self.my_library)} book(s) from local library.")
         except FileLoadError as e:
-            print(f"CRITICAL FILE ERROR: Cannot load library: {e}")
-            self.my_library = [] 
+            self._emit(f"CRITICAL FILE ERROR: Cannot load library: {e}")
+            return
+
+        for data in saved_data:
+            try:
+                self.my_library.append(_book_from_dict(data))
+            except KeyError as e:
+                self._emit(f"Warning: Skipping a saved book that is missing the {e} field.")
+        self.library_by_isbn = {b.isbn: b for b in self.my_library if b.isbn}
+        self._emit(f"Startup: Successfully loaded {len(self.my_library)} book(s) from local library.")
 
     def _display_results(self, results: list[Book]):
         """Prints formatted search results."""
-        print("\n--- Search Results ---")
+        lines = ["\n--- Search Results ---"]
         if not results:
-            print("No books found matching your query.")
-            return
+            lines.append("No books found matching your query.")
         for i, book in enumerate(results):
-            print(f"[{i + 1}]\n{book.display_info().strip()}\n----------------------")
+            lines.append(f"[{i + 1}]\n{book.display_info().strip()}\n----------------------")
+        self._out.write("\n".join(lines) + "\n")
 
     def handle_search(self):
         """Handles user search input, API call, and result processing/saving."""
-        query = input("Enter search keyword (title/author): ").strip()
+        query = self._prompt("Enter search keyword (title/author): ").strip()
         if not query:
-            print("Search query cannot be empty. Returning to menu.")
+            self._emit("Search query cannot be empty. Returning to menu.")
             return
         
         try:
-            print(f"\nSearching API for '{query}'...")
+            self._emit(f"\nSearching API for '{query}'...")
+            self._flush()  # Show progress before blocking on the network
             search_results_data = self.api_client.search_books(query)
             
             if not search_results_data:
-                print("Search finished. No books found.")
+                self._emit("Search finished. No books found.")
                 return
             
-            temp_results = [Book(**data) for data in search_results_data]
+            temp_results = [_book_from_dict(data) for data in search_results_data]
             self._display_results(temp_results)
             self._handle_save_selection(temp_results)
             
         except APIError as e:
-            print(f"\nAPI SEARCH FAILED: {e}")
+            self._emit(f"\nAPI SEARCH FAILED: {e}")
 
     def _handle_save_selection(self, results: list[Book]):
         """Allows user to save a book from search results to their library."""
         while True:
-            selection = input("Enter book number to save, or 'n' to cancel: ").lower().strip()
+            selection = self._prompt("Enter book number to save, or 'n' to cancel: ").lower().strip()
             if selection == 'n': return
 
             try:
                 index = int(selection) - 1
                 if 0 <= index < len(results):
                     book_to_save = results[index]
+                    if book_to_save.isbn in self.library_by_isbn:
+                        self._emit(f"\n'{book_to_save.title}' is already in your library.")
+                        return
+
                     self.my_library.append(book_to_save)
+                    if book_to_save.isbn:
+                        self.library_by_isbn[book_to_save.isbn] = book_to_save
+                    self.file_manager.append_book(book_to_save.to_dict())
                     
-                    library_data_to_save = [b.to_dict() for b in self.my_library]
-                    self.file_manager.save_library(library_data_to_save)
-                    
-                    print(f"\nSUCCESS: '{book_to_save.title}' added and library saved.")
+                    self._emit(f"\nSUCCESS: '{book_to_save.title}' added and library saved.")
                     return
                 else:
-                    print("Invalid selection number. Must be one of the options listed.")
+                    self._emit("Invalid selection number. Must be one of the options listed.")
             
             except ValueError:
-                print("Invalid input. Please enter a number or 'n'.")
+                self._emit("Invalid input. Please enter a number or 'n'.")
             except FileLoadError as e:
-                print(f"FATAL SAVE ERROR: Could not save the library after adding the book. {e}")
+                self._emit(f"FATAL SAVE ERROR: Could not save the library after adding the book. {e}")
                 return 
 
+    def handle_batch_search(self):
+        """Runs every query in a text file (one per line) concurrently, then offers saving per query."""
+        path = self._prompt("Enter path to a text file of queries (one per line): ").strip()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                queries = [line.strip() for line in f if line.strip()]
+        except (OSError, UnicodeDecodeError) as e:
+            self._emit(f"Could not read query file: {e}")
+            return
+        if not queries:
+            self._emit("Query file is empty. Returning to menu.")
+            return
+
+        self._emit(f"\nSearching API for {len(queries)} queries...")
+        self._flush()  # Show progress before blocking on the network
+        all_results = self.api_client.search_many(queries)
+
+        for query, results in zip(queries, all_results):
+            self._emit(f"\n=== Results for '{query}' ===")
+            if isinstance(results, Exception):
+                self._emit(f"API SEARCH FAILED: {results}")
+                continue
+            temp_results = [_book_from_dict(data) for data in results]
+            self._display_results(temp_results)
+            if temp_results:
+                self._handle_save_selection(temp_results)
+
     def handle_view_library(self):
         """Displays all books in the user's local library."""
-        print("\n--- Your Saved Library ---")
+        lines = ["\n--- Your Saved Library ---"]
         if not self.my_library:
-            print("Your library is currently empty. Try searching for some books!")
+            lines.append("Your library is currently empty. Try searching for some books!")
         else:
-            for i, book in enumerate(self.my_library):
-                print(f"[{i+1}] {book.title} by {book.author}")
+            lines.extend(f"[{i+1}] {book.title} by {book.author}" for i, book in enumerate(self.my_library))
+        self._out.write("\n".join(lines) + "\n")
 
     def main_menu(self):
         """Displays the main menu options."""
-        print("\n==================================")
-        print("📖 Book Search & Library App")
-        print("==================================")
-        print("1. Search Books (via External API)")
-        print("2. View My Saved Library (File)")
-        print("3. Exit Application")
-        return input("Enter your choice : ").strip()
+        self._emit("\n==================================")
+        self._emit("📖 Book Search & Library App")
+        self._emit("==================================")
+        self._emit("1. Search Books (via External API)")
+        self._emit("2. View My Saved Library (File)")
+        self._emit("3. Batch Search from File")
+        self._emit("4. Exit Application")
+        return self._prompt("Enter your choice : ").strip()
 
     def run(self):
         """Main application loop."""
+        try:
+            self._run_menu_loop()
+        finally:
+            self._flush()
+
+    def _run_menu_loop(self):
+        """Dispatches menu choices until the user exits."""
         while True:
             choice = self.main_menu()
             
@@ -230,10 +686,16 @@ class BookSearchApp:
             elif choice == '2':
                 self.handle_view_library()
             elif choice == '3':
-                print("Exiting application. Thanks for using the Book Search App!")
+                self.handle_batch_search()
+            elif choice == '4':
+                try:
+                    self.file_manager.close()
+                except FileLoadError as e:
+                    self._emit(f"FATAL SAVE ERROR: Could not flush the library to disk. {e}")
+                self._emit("Exiting application. Thanks for using the Book Search App!")
                 break
             else:
-                print(f"'{choice}' is not a valid choice. Please select 1, 2, or 3.")
+                self._emit(f"'{choice}' is not a valid choice. Please select 1, 2, 3, or 4.")
 
 #Entry point
 if __name__ == '__main__':